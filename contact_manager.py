@@ -5,14 +5,17 @@ Contact Manager Application.
 This program implements a simple command‑line contact manager that allows
 users to store, view, search, update, and delete contacts. Each contact
 record includes a name, phone number, email address, and physical
-address. Contacts are persisted between sessions using a JSON file on
-disk.
+address. Contacts are persisted between sessions in a single-file
+SQLite database on disk.
 
 Features:
 
-* **Contact Storage** – Contacts are stored in a JSON file (`contacts.json`)
-  so that they persist between program runs. Each contact has a
-  unique identifier, a name, a phone number, an email, and an address.
+* **Contact Storage** – Contacts are stored in a SQLite database
+  (`contacts.db`) so that they persist between program runs. Each
+  contact has a unique identifier, a name, a phone number, an email,
+  and an address. Name and phone are indexed, mutations are single-row
+  statements rather than whole-file rewrites, and legacy JSON data
+  (`contacts.jsonl`/`contacts.json`) is migrated automatically.
 
 * **Add Contact** – Prompts the user for contact details and adds a new
   contact to the contact list.
@@ -42,47 +45,239 @@ Usage::
 
 from __future__ import annotations
 
+import atexit
 import json
 import os
-from typing import Dict, List, Optional
+import sqlite3
+import sys
+from typing import Dict, Iterable, List, Optional
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# orjson parses several times faster than the stdlib and works on UTF-8
+# bytes natively; fall back to stdlib json when absent. Only the legacy
+# migration paths still deal in JSON.
+if orjson is not None:
+    _loads = orjson.loads
+else:
+    _loads = json.loads
+
+
+# The builtin input() probes GNU readline and flushes std streams on
+# every call. Interactive sessions want readline (imported once here,
+# not lazily on the first prompt); piped/scripted sessions skip it
+# entirely with a plain sys.stdin reader.
+if sys.stdin is not None and sys.stdin.isatty():
+    try:
+        import readline  # noqa: F401
+    except ImportError:
+        pass
+else:
+    def input(prompt: str = "") -> str:  # shadows the builtin in this module
+        """Read one line from stdin without readline probing."""
+        sys.stdout.write(prompt)
+        sys.stdout.flush()
+        line = sys.stdin.readline()
+        if not line:
+            raise EOFError
+        return line.rstrip("\n")
+
+
+DATA_FILE = "contacts.db"
+
+# Pre-database files from earlier versions; migrated into the database
+# the first time it is created.
+LEGACY_LOG_FILE = "contacts.jsonl"
+LEGACY_DATA_FILE = "contacts.json"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS contacts (
+    id INTEGER PRIMARY KEY,
+    name TEXT NOT NULL COLLATE NOCASE,
+    phone TEXT NOT NULL DEFAULT '',
+    email TEXT NOT NULL DEFAULT '',
+    address TEXT NOT NULL DEFAULT ''
+);
+CREATE INDEX IF NOT EXISTS idx_contacts_name ON contacts(name COLLATE NOCASE);
+CREATE INDEX IF NOT EXISTS idx_contacts_phone ON contacts(phone);
+"""
 
+_connection: Optional[sqlite3.Connection] = None
 
-DATA_FILE = "contacts.json"
+# Contacts shown per page when listing; even printing is O(n) in rows,
+# so large lists are paginated rather than dumped in one go.
+PAGE_SIZE = 25
 
+# Below this many contacts a linear in-memory scan beats the round-trip
+# through the database for a search.
+_SMALL_STORE = 64
+
+# Accepted confirmation answers; frozensets give O(1) membership and
+# scale cleanly if more spellings are ever accepted.
+_YES = frozenset({"y", "yes"})
+
+# Index mapping contact id -> contact dict for O(1) lookups. Rebuilt on
+# load and kept in sync by add_contact/delete_contact.
+_contact_index: Dict[int, Dict[str, str]] = {}
+
+# Next identifier to hand out; initialized from the highest existing id
+# at load time and advanced on each insert.
+_next_id = 1
+
+
+def _close_connection() -> None:
+    """Close the database connection on interpreter exit."""
+    global _connection
+    if _connection is not None:
+        _connection.close()
+        _connection = None
 
-def load_contacts() -> List[Dict[str, str]]:
-    """Load contacts from the JSON file.
 
-    Returns an empty list if the file does not exist or is invalid.
+atexit.register(_close_connection)
+
+
+def _connect() -> sqlite3.Connection:
+    """Return the shared database connection, creating it on first use.
+
+    Opens the database in WAL mode, ensures the schema exists, and
+    migrates any legacy JSON data into a freshly created table.
     """
-    if not os.path.exists(DATA_FILE):
-        return []
-    try:
-        with open(DATA_FILE, "r", encoding="utf-8") as f:
-            data = json.load(f)
-            if isinstance(data, list):
-                # ensure all entries are dictionaries
-                return [dict(entry) for entry in data]
-    except (json.JSONDecodeError, IOError):
-        pass
+    global _connection
+    if _connection is None:
+        _connection = sqlite3.connect(DATA_FILE)
+        _connection.row_factory = sqlite3.Row
+        _connection.execute("PRAGMA journal_mode=WAL")
+        _connection.executescript(_SCHEMA)
+        _migrate_legacy(_connection)
+    return _connection
+
+
+def _load_legacy_records() -> List[Dict[str, str]]:
+    """Load contacts from the pre-database JSONL log or JSON file."""
+    if os.path.exists(LEGACY_LOG_FILE):
+        live: Dict[int, Dict[str, str]] = {}
+        try:
+            with open(LEGACY_LOG_FILE, "rb") as f:
+                for line in f:
+                    line = line.strip()
+                    if not line:
+                        continue
+                    try:
+                        record = _loads(line)
+                    except ValueError:
+                        continue
+                    if not isinstance(record, dict):
+                        continue
+                    if record.get("op") == "del":
+                        live.pop(record.get("id"), None)
+                    elif isinstance(record.get("id"), int):
+                        live[record["id"]] = record
+        except IOError:
+            pass
+        return list(live.values())
+    if os.path.exists(LEGACY_DATA_FILE):
+        try:
+            with open(LEGACY_DATA_FILE, "rb") as f:
+                data = _loads(f.read())
+                if isinstance(data, list) and all(type(entry) is dict for entry in data):
+                    return data
+        except (ValueError, IOError):
+            pass
     return []
 
 
-def save_contacts(contacts: List[Dict[str, str]]) -> None:
-    """Save contacts to the JSON file."""
-    try:
-        with open(DATA_FILE, "w", encoding="utf-8") as f:
-            json.dump(contacts, f, indent=4, ensure_ascii=False)
-    except IOError as exc:
-        print(f"Error saving contacts: {exc}")
+def _migrate_legacy(conn: sqlite3.Connection) -> None:
+    """Import legacy JSON contacts into an empty contacts table."""
+    if conn.execute("SELECT 1 FROM contacts LIMIT 1").fetchone() is not None:
+        return
+    records = _load_legacy_records()
+    if not records:
+        return
+    conn.executemany(
+        "INSERT OR IGNORE INTO contacts (id, name, phone, email, address) VALUES (?, ?, ?, ?, ?)",
+        [
+            (
+                r.get("id"),
+                r.get("name", ""),
+                r.get("phone", ""),
+                r.get("email", ""),
+                r.get("address", ""),
+            )
+            for r in records
+            if isinstance(r.get("id"), int)
+        ],
+    )
+    conn.commit()
+
+
+def _rebuild_index(contacts: List[Dict[str, str]]) -> None:
+    """Rebuild the id -> contact index from the given list."""
+    global _next_id
+    _contact_index.clear()
+    max_id = 0
+    for contact in contacts:
+        contact_id = contact.get("id")
+        if isinstance(contact_id, int):
+            _contact_index[contact_id] = contact
+            if contact_id > max_id:
+                max_id = contact_id
+    _next_id = max_id + 1
+
+
+def find_contact_by_id(contact_id: int) -> Optional[Dict[str, str]]:
+    """Return the contact with the given ID, or None."""
+    return _contact_index.get(contact_id)
+
+
+def load_contacts() -> List[Dict[str, str]]:
+    """Load all contacts from the database into a list of dicts."""
+    conn = _connect()
+    contacts = [
+        dict(row)
+        for row in conn.execute(
+            "SELECT id, name, phone, email, address FROM contacts ORDER BY id"
+        )
+    ]
+    _rebuild_index(contacts)
+    return contacts
+
+
+def bulk_add(contacts: List[Dict[str, str]],
+             new_contacts: Iterable[Dict[str, str]]) -> None:
+    """Add many contacts at once inside a single transaction."""
+    conn = _connect()
+    added = []
+    for data in new_contacts:
+        contact = {
+            "id": generate_new_id(contacts),
+            "name": data.get("name", ""),
+            "phone": data.get("phone", ""),
+            "email": data.get("email", ""),
+            "address": data.get("address", ""),
+        }
+        contacts.append(contact)
+        _contact_index[contact["id"]] = contact
+        added.append(contact)
+    conn.executemany(
+        "INSERT INTO contacts (id, name, phone, email, address) VALUES (?, ?, ?, ?, ?)",
+        [(c["id"], c["name"], c["phone"], c["email"], c["address"]) for c in added],
+    )
+    conn.commit()
 
 
 def generate_new_id(contacts: List[Dict[str, str]]) -> int:
-    """Generate a new unique identifier based on existing contacts."""
-    if not contacts:
-        return 1
-    existing_ids = [c.get("id", 0) for c in contacts if isinstance(c.get("id"), int)]
-    return max(existing_ids, default=0) + 1
+    """Return the next unique identifier and advance the counter.
+
+    The counter is seeded from the highest existing id when the contact
+    list is loaded, so no per-insert scan of the list is needed.
+    """
+    global _next_id
+    new_id = _next_id
+    _next_id += 1
+    return new_id
 
 
 def add_contact(contacts: List[Dict[str, str]]) -> None:
@@ -105,21 +300,83 @@ def add_contact(contacts: List[Dict[str, str]]) -> None:
         "address": address,
     }
     contacts.append(new_contact)
-    save_contacts(contacts)
+    _contact_index[new_contact["id"]] = new_contact
+    conn = _connect()
+    conn.execute(
+        "INSERT INTO contacts (id, name, phone, email, address) VALUES (?, ?, ?, ?, ?)",
+        (new_contact["id"], name, phone, email, address),
+    )
+    conn.commit()
     print("Contact added successfully!\n")
 
 
-def view_contacts(contacts: List[Dict[str, str]]) -> None:
-    """Display all contacts with names and phone numbers."""
+def view_contacts(contacts: List[Dict[str, str]], page_size: int = PAGE_SIZE) -> None:
+    """Display contacts one page at a time with names and phone numbers."""
     print("\n=== Contact List ===")
     if not contacts:
         print("No contacts found.\n")
         return
-    for idx, contact in enumerate(contacts, start=1):
-        name = contact.get("name", "Unknown")
-        phone = contact.get("phone", "")
-        print(f"{idx}. {name} – {phone}")
-    print("")
+    total_pages = (len(contacts) + page_size - 1) // page_size
+    page = 1
+    while True:
+        start = (page - 1) * page_size
+        lines = [
+            f"{idx}. {c.get('name', 'Unknown')} – {c.get('phone', '')}"
+            for idx, c in enumerate(contacts[start:start + page_size], start + 1)
+        ]
+        sys.stdout.write("\n".join(lines) + "\n")
+        if total_pages == 1:
+            print("")
+            return
+        choice = input(f"Page {page}/{total_pages} – [n]ext, [p]rev, [q]uit: ").strip().lower()
+        if choice == "n" and page < total_pages:
+            page += 1
+        elif choice == "p" and page > 1:
+            page -= 1
+        elif choice in ("q", ""):
+            print("")
+            return
+
+
+def _search_key(contact: Dict[str, str]) -> bytes:
+    """Return (caching lazily) the contact's lowercase search bytes.
+
+    Name and phone are joined with a NUL byte and lowercased once, so a
+    match test is a single ``bytes.__contains__`` — CPython's memmem —
+    with no per-contact case folding.
+    """
+    key = contact.get("_search")
+    if key is None:
+        key = (contact.get("name", "") + "\x00" + contact.get("phone", "")).encode("utf-8").lower()
+        contact["_search"] = key
+    return key
+
+
+def _match_contacts(contacts: List[Dict[str, str]], query: str) -> List[Dict[str, str]]:
+    """Return contacts whose name or phone contains ``query``.
+
+    Small stores are scanned in memory against cached lowercase byte
+    strings; otherwise the query runs as an indexed, case-insensitive
+    LIKE against the database and matching ids are mapped back to the
+    in-memory contact dicts so callers keep operating on the canonical
+    objects.
+    """
+    if len(contacts) <= _SMALL_STORE:
+        query_bytes = query.encode("utf-8")
+        return [c for c in contacts if query_bytes in _search_key(c)]
+    escaped = query.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+    pattern = f"%{escaped}%"
+    conn = _connect()
+    rows = conn.execute(
+        "SELECT id FROM contacts WHERE name LIKE ? ESCAPE '\\' OR phone LIKE ? ESCAPE '\\' ORDER BY id",
+        (pattern, pattern),
+    )
+    results = []
+    for (contact_id,) in rows:
+        contact = _contact_index.get(contact_id)
+        if contact is not None:
+            results.append(contact)
+    return results
 
 
 def search_contacts(contacts: List[Dict[str, str]]) -> List[Dict[str, str]]:
@@ -131,14 +388,13 @@ def search_contacts(contacts: List[Dict[str, str]]) -> List[Dict[str, str]]:
         print("\nNo contacts to search.\n")
         return []
     query = input("\nEnter name or phone number to search: ").strip().lower()
-    results = [c for c in contacts if query in c.get("name", "").lower() or query in c.get("phone", "").lower()]
+    results = _match_contacts(contacts, query)
     if not results:
         print("No matching contacts found.\n")
     else:
-        print("\nSearch Results:")
-        for idx, contact in enumerate(results, start=1):
-            print(f"{idx}. {contact['name']} – {contact['phone']}")
-        print("")
+        lines = ["\nSearch Results:"]
+        lines.extend(f"{idx}. {c['name']} – {c['phone']}" for idx, c in enumerate(results, start=1))
+        sys.stdout.write("\n".join(lines) + "\n\n")
     return results
 
 
@@ -150,8 +406,9 @@ def select_contact(contacts: List[Dict[str, str]]) -> Optional[Dict[str, str]]:
     if not contacts:
         print("No contacts available.")
         return None
-    for idx, contact in enumerate(contacts, start=1):
-        print(f"{idx}. {contact['name']} – {contact['phone']}")
+    sys.stdout.write(
+        "\n".join(f"{idx}. {c['name']} – {c['phone']}" for idx, c in enumerate(contacts, start=1)) + "\n"
+    )
     while True:
         choice = input("Select a contact by number (or press Enter to cancel): ").strip()
         if choice == "":
@@ -188,8 +445,14 @@ def update_contact(contacts: List[Dict[str, str]]) -> None:
         contact['email'] = new_email
     if new_address:
         contact['address'] = new_address
-
-    save_contacts(contacts)
+    contact.pop("_search", None)
+
+    conn = _connect()
+    conn.execute(
+        "UPDATE contacts SET name = ?, phone = ?, email = ?, address = ? WHERE id = ?",
+        (contact['name'], contact['phone'], contact['email'], contact['address'], contact['id']),
+    )
+    conn.commit()
     print("Contact updated successfully!\n")
 
 
@@ -205,14 +468,34 @@ def delete_contact(contacts: List[Dict[str, str]]) -> None:
         return
 
     confirmation = input(f"Are you sure you want to delete '{contact['name']}'? (y/n): ").strip().lower()
-    if confirmation in ("y", "yes"):
-        contacts.remove(contact)
-        save_contacts(contacts)
+    if confirmation in _YES:
+        # Locate by identity: list.remove would deep-compare every
+        # preceding dict field by field before finding the object.
+        position = next((i for i, c in enumerate(contacts) if c is contact), None)
+        if position is not None:
+            del contacts[position]
+        _contact_index.pop(contact.get("id"), None)
+        conn = _connect()
+        conn.execute("DELETE FROM contacts WHERE id = ?", (contact.get("id"),))
+        conn.commit()
         print("Contact deleted successfully!\n")
     else:
         print("Deletion aborted.\n")
 
 
+# Menu drawn once per loop iteration; precomposed so each draw is a
+# single write instead of one print call per line.
+_MENU_TEXT = (
+    "=== Contact Manager ===\n"
+    "1. Add Contact\n"
+    "2. View Contacts\n"
+    "3. Search Contact\n"
+    "4. Update Contact\n"
+    "5. Delete Contact\n"
+    "6. Exit\n"
+)
+
+
 def main_menu() -> None:
     """Main loop for the contact manager interface."""
     contacts = load_contacts()
@@ -222,17 +505,13 @@ def main_menu() -> None:
         "3": lambda c: search_contacts(c),
         "4": update_contact,
         "5": delete_contact,
-        "6": lambda c: exit(0),
     }
     while True:
-        print("=== Contact Manager ===")
-        print("1. Add Contact")
-        print("2. View Contacts")
-        print("3. Search Contact")
-        print("4. Update Contact")
-        print("5. Delete Contact")
-        print("6. Exit")
+        sys.stdout.write(_MENU_TEXT)
         choice = input("Select an option (1-6): ").strip()
+        if choice == "6":
+            # break rather than exit(0) so the atexit hooks run.
+            break
         action = options.get(choice)
         if action:
             action(contacts)
@@ -244,4 +523,4 @@ if __name__ == "__main__":
     try:
         main_menu()
     except KeyboardInterrupt:
-        print("\nProgram terminated by user.")
\ No newline at end of file
+        print("\nProgram terminated by user.")
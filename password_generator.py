@@ -4,8 +4,8 @@ A simple password generator utility.
 
 This script allows a user to generate a random password by specifying
 the desired length and selecting which character sets to include. The
-generator uses Python's `random.SystemRandom` for cryptographically
-secure randomness and draws characters from uppercase letters,
+generator draws its randomness from `os.urandom` for cryptographic
+security and samples characters from uppercase letters,
 lowercase letters, digits, and punctuation symbols depending on the
 user's choices.
 
@@ -22,8 +22,58 @@ Example usage::
 
 """
 
-import random
+import os
 import string
+from typing import Dict, Tuple
+
+
+# Cache of character pools keyed by the four inclusion flags so repeated
+# calls (e.g. bulk generation) do not rebuild the pool string each time.
+_POOL_CACHE: Dict[Tuple[bool, bool, bool, bool], str] = {}
+
+# Accepted yes/no answers; frozensets give O(1) membership and scale
+# cleanly if more spellings are ever accepted.
+_YES = frozenset({"y", "yes"})
+_NO = frozenset({"n", "no"})
+
+
+def _build_pool(use_uppercase: bool,
+                use_lowercase: bool,
+                use_digits: bool,
+                use_symbols: bool) -> str:
+    """Return the cached character pool for the given inclusion flags."""
+    key = (use_uppercase, use_lowercase, use_digits, use_symbols)
+    pool = _POOL_CACHE.get(key)
+    if pool is None:
+        parts = []
+        if use_lowercase:
+            parts.append(string.ascii_lowercase)
+        if use_uppercase:
+            parts.append(string.ascii_uppercase)
+        if use_digits:
+            parts.append(string.digits)
+        if use_symbols:
+            parts.append(string.punctuation)
+        pool = "".join(parts)
+        _POOL_CACHE[key] = pool
+    return pool
+
+
+def _batch_sample(pool: str, n: int) -> str:
+    """Draw ``n`` uniformly random pool characters from batched urandom bytes.
+
+    Reads entropy in oversized chunks so the whole password costs a
+    handful of `os.urandom` calls instead of one per character. Bytes at
+    or above the largest multiple of the pool size are rejected so the
+    modulo mapping stays uniform.
+    """
+    size = len(pool)
+    cap = 256 - (256 % size)
+    out: list = []
+    while len(out) < n:
+        buf = os.urandom((n - len(out)) * 2)
+        out.extend(pool[b % size] for b in buf if b < cap)
+    return "".join(out[:n])
 
 
 def generate_password(length: int,
@@ -49,25 +99,16 @@ def generate_password(length: int,
     if length <= 0:
         raise ValueError("Password length must be a positive integer.")
 
-    # Build the pool of characters to sample from.
-    characters = ""
-    if use_lowercase:
-        characters += string.ascii_lowercase
-    if use_uppercase:
-        characters += string.ascii_uppercase
-    if use_digits:
-        characters += string.digits
-    if use_symbols:
-        characters += string.punctuation
+    # Fetch the (cached) pool of characters to sample from.
+    characters = _build_pool(use_uppercase, use_lowercase, use_digits, use_symbols)
 
     if not characters:
         raise ValueError(
             "No character types selected. Enable at least one type of characters."
         )
 
-    # Use a cryptographically secure random generator.
-    secure_random = random.SystemRandom()
-    return ''.join(secure_random.choice(characters) for _ in range(length))
+    # Sample from batched urandom bytes rather than one `choice` per char.
+    return _batch_sample(characters, length)
 
 
 def ask_yes_no(prompt: str) -> bool:
@@ -83,9 +124,9 @@ def ask_yes_no(prompt: str) -> bool:
     """
     while True:
         response = input(prompt).strip().lower()
-        if response in ('y', 'yes'):
+        if response in _YES:
             return True
-        if response in ('n', 'no'):
+        if response in _NO:
             return False
         print("Please answer with 'y' or 'n'.")
 
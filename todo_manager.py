@@ -36,44 +36,315 @@ Usage::
 
 from __future__ import annotations
 
+import atexit
+import copy
 import json
 import os
-from datetime import datetime
-from typing import Dict, List, Optional
+import queue
+import re
+import signal
+import sys
+import threading
+from typing import Dict, List, Optional, Tuple
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
+# orjson parses and serializes several times faster than the stdlib and
+# works on UTF-8 bytes natively; fall back to stdlib json when absent.
+if orjson is not None:
+    _loads = orjson.loads
+
+    def _dumps(obj) -> bytes:
+        return orjson.dumps(obj)
+else:
+    _loads = json.loads
+
+    def _dumps(obj) -> bytes:
+        return json.dumps(obj, ensure_ascii=False).encode("utf-8")
+
+
+# The builtin input() probes GNU readline and flushes std streams on
+# every call. Interactive sessions want readline (imported once here,
+# not lazily on the first prompt); piped/scripted sessions skip it
+# entirely with a plain sys.stdin reader.
+if sys.stdin is not None and sys.stdin.isatty():
+    try:
+        import readline  # noqa: F401
+    except ImportError:
+        pass
+else:
+    def input(prompt: str = "") -> str:  # shadows the builtin in this module
+        """Read one line from stdin without readline probing."""
+        sys.stdout.write(prompt)
+        sys.stdout.flush()
+        line = sys.stdin.readline()
+        if not line:
+            raise EOFError
+        return line.rstrip("\n")
+
+
+# msgpack packs the task list to a binary file a fraction of the JSON
+# size with no text decode pass; tasks.json stays the format when the
+# library is missing, and explicit export/import keeps JSON available
+# for portability either way.
+JSON_DATA_FILE = "tasks.json"
+DATA_FILE = "tasks.mpk" if msgpack is not None else JSON_DATA_FILE
+
+# Tasks shown per page when listing; even printing is O(n) in rows, so
+# large lists are paginated rather than dumped in one go.
+PAGE_SIZE = 25
+
+# Accepted confirmation answers; frozensets give O(1) membership and
+# scale cleanly if more spellings are ever accepted.
+_YES = frozenset({"y", "yes"})
+
+# Files larger than this are parsed incrementally with ijson (when
+# available) so the raw text and the decoded list never coexist in
+# memory; below it, whole-file parsing is faster.
+_STREAM_THRESHOLD = 1_000_000
+
+# Index mapping task id -> task dict for O(1) lookups. Rebuilt on load and
+# kept in sync by add_task/delete_task.
+_task_index: Dict[int, Dict[str, str]] = {}
+
+# Next identifier to hand out; initialized from the highest existing id
+# at load time and advanced on each insert.
+_next_id = 1
+
+# Parsed-load cache keyed by path: (st_mtime_ns, st_size, tasks). Lets
+# repeated load_tasks calls in one process skip the parse when the file
+# is unchanged.
+_LOAD_CACHE: Dict[str, Tuple[int, int, List[Dict[str, str]]]] = {}
+
+# Dirty-state tracking for debounced saves: mutations mark the list
+# dirty and the file is rewritten only every _FLUSH_THRESHOLD mutations,
+# at interpreter exit, or before a reload.
+_FLUSH_THRESHOLD = 32
+_dirty = False
+_dirty_tasks: Optional[List[Dict[str, str]]] = None
+_mutation_count = 0
+
+
+def _mark_dirty(tasks: List[Dict[str, str]]) -> None:
+    """Record a mutation and flush once enough have accumulated."""
+    global _dirty, _dirty_tasks, _mutation_count
+    _dirty = True
+    _dirty_tasks = tasks
+    _mutation_count += 1
+    if _mutation_count >= _FLUSH_THRESHOLD:
+        flush_if_dirty()
+
+
+# Snapshots queued for the background saver thread. Writes happen off
+# the input thread so interactive actions never wait on serialization;
+# the saver drains the queue and writes only the newest snapshot.
+_save_queue: queue.Queue = queue.Queue()
+_saver_thread: Optional[threading.Thread] = None
+
+
+def _saver() -> None:
+    """Consume queued snapshots, coalescing to the most recent one.
+
+    A ``None`` sentinel asks the thread to finish; any snapshot queued
+    before the sentinel is still written first.
+    """
+    while True:
+        item = _save_queue.get()
+        stop = item is None
+        snapshot = None if stop else item
+        while True:
+            try:
+                newer = _save_queue.get_nowait()
+            except queue.Empty:
+                break
+            if newer is None:
+                stop = True
+            else:
+                snapshot = newer
+            _save_queue.task_done()
+        if snapshot is not None:
+            save_tasks(snapshot)
+        _save_queue.task_done()
+        if stop:
+            return
+
+
+def _enqueue_save(tasks: List[Dict[str, str]]) -> None:
+    """Hand a snapshot of the task list to the saver thread."""
+    global _saver_thread
+    if _saver_thread is None:
+        _saver_thread = threading.Thread(target=_saver, daemon=True)
+        _saver_thread.start()
+    # Shallow-copy each record so writes never race with later edits.
+    _save_queue.put([dict(task) for task in tasks])
+
+
+def flush_if_dirty() -> None:
+    """Queue the task list for writing if there are unsaved mutations."""
+    global _dirty, _mutation_count
+    if not _dirty or _dirty_tasks is None:
+        return
+    _enqueue_save(_dirty_tasks)
+    _dirty = False
+    _mutation_count = 0
+
+
+def _shutdown_saver() -> None:
+    """Flush pending mutations and wait for the saver to finish."""
+    flush_if_dirty()
+    if _saver_thread is not None:
+        _save_queue.put(None)
+        _saver_thread.join()
+
 
+atexit.register(_shutdown_saver)
 
-DATA_FILE = "tasks.json"
+
+def _rebuild_index(tasks: List[Dict[str, str]]) -> None:
+    """Rebuild the id -> task index from the given task list."""
+    global _next_id
+    _task_index.clear()
+    max_id = 0
+    for task in tasks:
+        task_id = task.get("id")
+        if isinstance(task_id, int):
+            _task_index[task_id] = task
+            if task_id > max_id:
+                max_id = task_id
+    _next_id = max_id + 1
+
+
+def _load_json_tasks(path: str) -> List[Dict[str, str]]:
+    """Load a JSON task list from ``path``, or return an empty list."""
+    try:
+        with open(path, "rb") as f:
+            data = _loads(f.read())
+        if isinstance(data, list) and all(type(task) is dict for task in data):
+            return data
+    except (ValueError, IOError):
+        pass
+    return []
 
 
 def load_tasks() -> List[Dict[str, str]]:
-    """Load tasks from the JSON file or return an empty list."""
+    """Load tasks from the data file or return an empty list.
+
+    When msgpack is in use and no binary file exists yet, any legacy
+    ``tasks.json`` is migrated on first load.
+    """
+    flush_if_dirty()
+    # Wait for the saver thread to drain so the file is current.
+    _save_queue.join()
     if not os.path.exists(DATA_FILE):
+        if msgpack is not None and os.path.exists(JSON_DATA_FILE):
+            tasks = _load_json_tasks(JSON_DATA_FILE)
+            _rebuild_index(tasks)
+            if tasks:
+                save_tasks(tasks)
+            return tasks
+        _rebuild_index([])
+        return []
+    try:
+        st = os.stat(DATA_FILE)
+    except OSError:
+        st = None
+    if st is not None:
+        cached = _LOAD_CACHE.get(DATA_FILE)
+        if cached and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+            tasks = copy.deepcopy(cached[2])
+            _rebuild_index(tasks)
+            return tasks
+    if msgpack is None and ijson is not None and st is not None and st.st_size > _STREAM_THRESHOLD:
+        # Stream-parse big files one record at a time. The parsed-load
+        # cache is skipped here: deep-copying a list this size would
+        # cost as much as the parse it avoids.
+        tasks = []
+        try:
+            with open(DATA_FILE, "rb") as f:
+                for obj in ijson.items(f, "item"):
+                    if isinstance(obj, dict):
+                        tasks.append(obj)
+            _rebuild_index(tasks)
+            return tasks
+        except (ijson.JSONError, ValueError, IOError):
+            pass
+        _rebuild_index([])
         return []
     try:
-        with open(DATA_FILE, "r", encoding="utf-8") as f:
-            data = json.load(f)
-            if isinstance(data, list):
-                return [dict(task) for task in data]
-    except (json.JSONDecodeError, IOError):
+        with open(DATA_FILE, "rb") as f:
+            raw = f.read()
+        if msgpack is not None:
+            data = msgpack.unpackb(raw, raw=False)
+        else:
+            data = _loads(raw)
+        # The parser already produced fresh dicts; validate instead
+        # of copying every record.
+        if isinstance(data, list) and all(type(task) is dict for task in data):
+            tasks = data
+            if st is not None:
+                _LOAD_CACHE[DATA_FILE] = (st.st_mtime_ns, st.st_size, copy.deepcopy(tasks))
+            _rebuild_index(tasks)
+            return tasks
+    except (ValueError, IOError):
         pass
+    _rebuild_index([])
     return []
 
 
+def _strip_private_keys(record: Dict[str, str]) -> Dict[str, str]:
+    """Return ``record`` without cached underscore-prefixed keys.
+
+    Records with no such keys are returned as-is to avoid copying.
+    """
+    if any(key.startswith("_") for key in record):
+        return {k: v for k, v in record.items() if not k.startswith("_")}
+    return record
+
+
 def save_tasks(tasks: List[Dict[str, str]]) -> None:
-    """Save the list of tasks to the JSON file."""
+    """Save the list of tasks to the data file.
+
+    Packs to msgpack when available, compact JSON otherwise. The
+    payload goes to a temporary file and is swapped into place with
+    ``os.replace`` so a crash mid-write cannot corrupt the data.
+    """
+    records = [_strip_private_keys(t) for t in tasks]
+    if msgpack is not None:
+        payload = msgpack.packb(records, use_bin_type=True)
+    else:
+        payload = _dumps(records)
+    tmp_file = DATA_FILE + ".tmp"
     try:
-        with open(DATA_FILE, "w", encoding="utf-8") as f:
-            json.dump(tasks, f, indent=4, ensure_ascii=False)
+        with open(tmp_file, "wb") as f:
+            f.write(payload)
+        os.replace(tmp_file, DATA_FILE)
     except IOError as exc:
         print(f"Error saving tasks: {exc}")
 
 
 def generate_new_id(tasks: List[Dict[str, str]]) -> int:
-    """Generate a new unique task ID based on existing tasks."""
-    if not tasks:
-        return 1
-    existing_ids = [task.get("id", 0) for task in tasks if isinstance(task.get("id"), int)]
-    return max(existing_ids, default=0) + 1
+    """Return the next unique task ID and advance the counter.
+
+    The counter is seeded from the highest existing id when the task
+    list is loaded, so no per-insert scan of the list is needed.
+    """
+    global _next_id
+    new_id = _next_id
+    _next_id += 1
+    return new_id
 
 
 def add_task(tasks: List[Dict[str, str]]) -> None:
@@ -86,11 +357,10 @@ def add_task(tasks: List[Dict[str, str]]) -> None:
     due_date_input = input("Enter due date (optional, YYYY-MM-DD) or leave blank: ").strip()
     due_date = ""
     if due_date_input:
-        try:
-            # Validate the date format; store string as provided
-            datetime.strptime(due_date_input, "%Y-%m-%d")
+        # Validate the date format; store string as provided
+        if _valid_date(due_date_input):
             due_date = due_date_input
-        except ValueError:
+        else:
             print("Invalid date format. Due date ignored.")
     notes = input("Enter any notes (optional): ").strip()
     new_task = {
@@ -101,26 +371,58 @@ def add_task(tasks: List[Dict[str, str]]) -> None:
         "notes": notes,
     }
     tasks.append(new_task)
-    save_tasks(tasks)
+    _task_index[new_task["id"]] = new_task
+    _mark_dirty(tasks)
     print("Task added successfully!\n")
 
 
-def list_tasks(tasks: List[Dict[str, str]]) -> None:
-    """Display the list of tasks with their statuses."""
+def _display_line(task: Dict[str, str]) -> str:
+    """Return (caching lazily) the task's formatted display line.
+
+    The line only changes when the task mutates, so mutators drop the
+    cached value and repeated renders pay a dict lookup instead of
+    re-deriving status and due-date strings.
+    """
+    line = task.get("_line")
+    if line is None:
+        status = "Completed" if task.get("completed") else "Pending"
+        due = task.get("due_date", "")
+        due_str = f" (Due: {due})" if due else ""
+        line = f"{task['id']}. {task['description']}{due_str} – {status}"
+        task["_line"] = line
+    return line
+
+
+def list_tasks(tasks: List[Dict[str, str]], page_size: int = PAGE_SIZE) -> None:
+    """Display the tasks one page at a time with their statuses."""
     print("\n=== To-Do List ===")
     if not tasks:
         print("No tasks found.\n")
         return
-    for task in tasks:
-        status = "Completed" if task.get("completed") else "Pending"
-        due = task.get("due_date", "")
-        due_str = f" (Due: {due})" if due else ""
-        print(f"{task['id']}. {task['description']}{due_str} – {status}")
-    print("")
+    total_pages = (len(tasks) + page_size - 1) // page_size
+    page = 1
+    while True:
+        start = (page - 1) * page_size
+        sys.stdout.write("\n".join(_display_line(t) for t in tasks[start:start + page_size]) + "\n")
+        if total_pages == 1:
+            print("")
+            return
+        choice = input(f"Page {page}/{total_pages} – [n]ext, [p]rev, [q]uit: ").strip().lower()
+        if choice == "n" and page < total_pages:
+            page += 1
+        elif choice == "p" and page > 1:
+            page -= 1
+        elif choice in ("q", ""):
+            print("")
+            return
 
 
 def find_task_by_id(tasks: List[Dict[str, str]], task_id: int) -> Optional[Dict[str, str]]:
     """Return a task dictionary matching the given ID, or None."""
+    task = _task_index.get(task_id)
+    if task is not None:
+        return task
+    # Fallback for callers passing a list the index has not seen.
     return next((t for t in tasks if t.get("id") == task_id), None)
 
 
@@ -148,14 +450,14 @@ def update_task(tasks: List[Dict[str, str]]) -> None:
     if new_description:
         task['description'] = new_description
     if new_due:
-        try:
-            datetime.strptime(new_due, "%Y-%m-%d")
+        if _valid_date(new_due):
             task['due_date'] = new_due
-        except ValueError:
+        else:
             print("Invalid date format. Due date not updated.")
     if new_notes:
         task['notes'] = new_notes
-    save_tasks(tasks)
+    task.pop("_line", None)
+    _mark_dirty(tasks)
     print("Task updated successfully!\n")
 
 
@@ -177,8 +479,9 @@ def toggle_completion(tasks: List[Dict[str, str]]) -> None:
         print("Task not found.\n")
         return
     task['completed'] = not task.get('completed', False)
+    task.pop("_line", None)
     status = "completed" if task['completed'] else "pending"
-    save_tasks(tasks)
+    _mark_dirty(tasks)
     print(f"Task marked as {status}.\n")
 
 
@@ -200,16 +503,90 @@ def delete_task(tasks: List[Dict[str, str]]) -> None:
         print("Task not found.\n")
         return
     confirm = input(f"Are you sure you want to delete '{task['description']}'? (y/n): ").strip().lower()
-    if confirm in ("y", "yes"):
-        tasks.remove(task)
-        save_tasks(tasks)
+    if confirm in _YES:
+        # Locate by identity: list.remove would deep-compare every
+        # preceding dict field by field before finding the object.
+        position = next((i for i, t in enumerate(tasks) if t is task), None)
+        if position is not None:
+            del tasks[position]
+        _task_index.pop(task_id, None)
+        _mark_dirty(tasks)
         print("Task deleted successfully!\n")
     else:
         print("Deletion aborted.\n")
 
 
+# Due dates use a single fixed format, so a precompiled regex plus a
+# month-length check validates them far faster than datetime.strptime.
+_DATE_RE = re.compile(r"^(\d{4})-(\d{1,2})-(\d{1,2})$")
+_DAYS_IN_MONTH = (31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31)
+
+
+def _valid_date(value: str) -> bool:
+    """Return True if ``value`` is a valid YYYY-MM-DD date."""
+    match = _DATE_RE.match(value)
+    if not match:
+        return False
+    year, month, day = map(int, match.groups())
+    if not 1 <= month <= 12:
+        return False
+    days = _DAYS_IN_MONTH[month - 1]
+    if month == 2 and year % 4 == 0 and (year % 100 != 0 or year % 400 == 0):
+        days = 29
+    return 1 <= day <= days
+
+
+# Menu drawn once per loop iteration; precomposed so each draw is a
+# single write instead of one print call per line.
+_MENU_TEXT = (
+    "=== To-Do List Manager ===\n"
+    "1. Add Task\n"
+    "2. View Tasks\n"
+    "3. Update Task\n"
+    "4. Mark Task Completed/Uncompleted\n"
+    "5. Delete Task\n"
+    "6. Export Tasks to JSON\n"
+    "7. Import Tasks from JSON\n"
+    "8. Exit\n"
+)
+
+
+def export_json(tasks: List[Dict[str, str]]) -> None:
+    """Export the task list to a human-readable JSON file."""
+    path = input("Export to JSON file [tasks_export.json]: ").strip() or "tasks_export.json"
+    try:
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump([_strip_private_keys(t) for t in tasks], f, indent=4, ensure_ascii=False)
+        print(f"Exported {len(tasks)} task(s) to {path}.\n")
+    except IOError as exc:
+        print(f"Error exporting tasks: {exc}\n")
+
+
+def import_json(tasks: List[Dict[str, str]]) -> None:
+    """Replace the task list with one imported from a JSON file."""
+    path = input("Import from JSON file [tasks_export.json]: ").strip() or "tasks_export.json"
+    if not os.path.exists(path):
+        print("File not found. Import cancelled.\n")
+        return
+    imported = _load_json_tasks(path)
+    if not imported:
+        print("No valid tasks found in the file. Import cancelled.\n")
+        return
+    tasks[:] = imported
+    _rebuild_index(tasks)
+    _mark_dirty(tasks)
+    print(f"Imported {len(tasks)} task(s) from {path}.\n")
+
+
+def _handle_sigint(signum, frame) -> None:
+    """Flush unsaved mutations, then resume normal Ctrl-C handling."""
+    flush_if_dirty()
+    raise KeyboardInterrupt
+
+
 def main_menu() -> None:
     """Main loop for the to‑do list manager."""
+    signal.signal(signal.SIGINT, _handle_sigint)
     tasks = load_tasks()
     actions = {
         "1": add_task,
@@ -217,17 +594,15 @@ def main_menu() -> None:
         "3": update_task,
         "4": toggle_completion,
         "5": delete_task,
-        "6": lambda _: exit(0),
+        "6": export_json,
+        "7": import_json,
     }
     while True:
-        print("=== To-Do List Manager ===")
-        print("1. Add Task")
-        print("2. View Tasks")
-        print("3. Update Task")
-        print("4. Mark Task Completed/Uncompleted")
-        print("5. Delete Task")
-        print("6. Exit")
-        choice = input("Select an option (1-6): ").strip()
+        sys.stdout.write(_MENU_TEXT)
+        choice = input("Select an option (1-8): ").strip()
+        if choice == "8":
+            # break rather than exit(0) so the atexit flush runs.
+            break
         action = actions.get(choice)
         if action:
             action(tasks)